@@ -2,41 +2,176 @@
 import os
 import shutil
 import hashlib
+import mmap
+import time
 import pandas as pd
 from datetime import datetime
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
-from openpyxl import load_workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.styles import PatternFill
 import threading
+import csv
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def compute_checksum(file_path, algo='sha256'):
-    hash_func = hashlib.new(algo)
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+DEFAULT_HASH_ALGO = 'blake3' if blake3 is not None else 'sha256'
+MMAP_THRESHOLD = 16 << 20
+MULTITHREAD_HASH_THRESHOLD = 64 << 20
+
+def advise_sequential(f):
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def drop_page_cache(f):
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+def compute_checksum(file_path, algo=DEFAULT_HASH_ALGO):
     try:
+        if algo == 'blake3':
+            if os.path.getsize(file_path) > MULTITHREAD_HASH_THRESHOLD:
+                hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            else:
+                hasher = blake3.blake3()
+            digest = hasher.update_mmap(file_path).hexdigest()
+            if hasattr(os, 'posix_fadvise'):
+                with open(file_path, 'rb') as f:
+                    drop_page_cache(f)
+            return digest
+        hash_func = hashlib.new(algo)
         with open(file_path, 'rb') as f:
-            while chunk := f.read(8192):
-                hash_func.update(chunk)
+            advise_sequential(f)
+            size = os.fstat(f.fileno()).st_size
+            if size > MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hash_func.update(mm)
+            else:
+                while chunk := f.read(1 << 20):
+                    hash_func.update(chunk)
+            drop_page_cache(f)
         return hash_func.hexdigest()
     except Exception as e:
         return f"ERROR: {e}"
 
-def get_file_size(file_path):
+def walk_fast(root_dir):
+    stack = [(root_dir, "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError as e:
+            print(f"Failed to scan directory: {dir_path} - {e}")
+            continue
+        with entries:
+            for entry in entries:
+                rel_path = rel_dir + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_path + os.sep))
+                else:
+                    try:
+                        entry_stat = entry.stat()
+                    except OSError as e:
+                        print(f"Failed to stat: {entry.path} - {e}")
+                        continue
+                    yield entry_stat, rel_path
+
+def fast_copy(src, dst):
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        advise_sequential(fsrc)
+        size = os.fstat(fsrc.fileno()).st_size
+        remaining = size
+
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+            except OSError:
+                pass
+
+        if remaining > 0 and hasattr(os, 'sendfile'):
+            try:
+                while remaining > 0:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), size - remaining, remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+            except OSError:
+                pass
+
+        if remaining > 0:
+            fsrc.seek(size - remaining)
+            shutil.copyfileobj(fsrc, fdst, 4 << 20)
+
+        fdst.flush()
+        drop_page_cache(fsrc)
+        drop_page_cache(fdst)
+
+    shutil.copystat(src, dst)
+
+def verify_pair(src, dst, algo=DEFAULT_HASH_ALGO):
+    if algo == 'blake3':
+        hash_func = blake3.blake3()
+    else:
+        hash_func = hashlib.new(algo)
     try:
-        return os.path.getsize(file_path)
-    except:
-        return None
-
-def file_exists(path):
-    return os.path.exists(path)
-
-def cleanup_old_backups(report_path, keep_last=7):
-    base_name = os.path.basename(report_path).replace(".xlsx", "")
-    folder = os.path.dirname(report_path)
+        with open(src, 'rb') as fsrc, open(dst, 'rb') as fdst:
+            advise_sequential(fsrc)
+            advise_sequential(fdst)
+            while True:
+                chunk_src = fsrc.read(1 << 20)
+                chunk_dst = fdst.read(1 << 20)
+                if chunk_src != chunk_dst:
+                    return False, None
+                if not chunk_src:
+                    break
+                hash_func.update(chunk_src)
+            drop_page_cache(fsrc)
+            drop_page_cache(fdst)
+        return True, hash_func.hexdigest()
+    except Exception:
+        return False, None
+
+def copy_and_hash(src, dst, algo=DEFAULT_HASH_ALGO):
+    if algo == 'blake3':
+        hash_func = blake3.blake3()
+    else:
+        hash_func = hashlib.new(algo)
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        advise_sequential(fsrc)
+        while chunk := fsrc.read(4 << 20):
+            hash_func.update(chunk)
+            fdst.write(chunk)
+        fdst.flush()
+        drop_page_cache(fsrc)
+        drop_page_cache(fdst)
+    shutil.copystat(src, dst)
+    return hash_func.hexdigest()
+
+def state_paths(report_path):
+    base = os.path.splitext(report_path)[0]
+    return base + ".parquet", base + "_audit.csv"
+
+def cleanup_old_backups(state_path, keep_last=7):
+    base_name, ext = os.path.splitext(os.path.basename(state_path))
+    folder = os.path.dirname(state_path)
     backups = sorted([
         os.path.join(folder, f) for f in os.listdir(folder)
-        if f.startswith(base_name + "_backup_") and f.endswith(".xlsx")
+        if f.startswith(base_name + "_backup_") and f.endswith(ext)
     ], key=os.path.getmtime, reverse=True)
 
     for old_backup in backups[keep_last:]:
@@ -45,35 +180,165 @@ def cleanup_old_backups(report_path, keep_last=7):
         except Exception as e:
             print(f"Failed to delete old backup: {old_backup} - {e}")
 
-def backup_excel(report_path):
-    if os.path.exists(report_path):
+def backup_state(state_path):
+    if os.path.exists(state_path):
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        backup_path = report_path.replace(".xlsx", f"_backup_{timestamp}.xlsx")
-        shutil.copy2(report_path, backup_path)
-        cleanup_old_backups(report_path, keep_last=7)
+        base, ext = os.path.splitext(state_path)
+        backup_path = f"{base}_backup_{timestamp}{ext}"
+        shutil.copy2(state_path, backup_path)
+        cleanup_old_backups(state_path, keep_last=7)
+
+def checksums_cached(row, source_size, source_mtime, dest_size, dest_mtime):
+    source_hash = row.get('Source Hash')
+    dest_hash = row.get('Dest Hash')
+    if pd.isna(source_hash) or pd.isna(dest_hash):
+        return False
+    if str(source_hash).startswith("ERROR") or str(dest_hash).startswith("ERROR"):
+        return False
+    if row.get('Checksum Algorithm') != DEFAULT_HASH_ALGO:
+        return False
+    return (
+        row.get('Source Size') == source_size and
+        str(row.get('Source MTime')) == str(source_mtime) and
+        row.get('Dest Size') == dest_size and
+        str(row.get('Dest MTime')) == str(dest_mtime)
+    )
+
+def fast_verify(row, src_index, dst_index):
+    relative_path = row.get('Relative Path')
+    source_stat = src_index.get(relative_path)
+    dest_stat = dst_index.get(relative_path)
+    if source_stat is None or dest_stat is None:
+        return False
+    if pd.isna(row.get('Date Copied to Folder 1')):
+        return False
+    return (source_stat.st_size == dest_stat.st_size and
+            source_stat.st_mtime_ns == dest_stat.st_mtime_ns)
+
+def process_one(index, row, folder1, src_index, dst_index, created_dirs, force_recopy, deep_verify=False):
+    relative_path = row.get('Relative Path')
+    source_path = row.get('Source Path')
+    dest_path = os.path.join(folder1, relative_path)
+
+    updates = {}
+    errors = []
+    counts = {'copied': 0, 'verified': 0, 'mismatched': 0, 'missing': 0}
+    date_copied = row.get('Date Copied to Folder 1')
+
+    source_stat = src_index.get(relative_path)
+    dest_stat = dst_index.get(relative_path)
+    exists1 = dest_stat is not None
+    exists2 = source_stat is not None
+    updates['Exists in Folder 1'] = exists1
+    updates['Exists in Folder 2'] = exists2
+
+    status = ""
+    copied_source_hash = None
+
+    if not exists2:
+        status = "Missing in Folder 2"
+        counts['missing'] += 1
+        errors.append(f"[{datetime.now()}] Missing in Folder 2 - {relative_path}")
+    elif not exists1 and force_recopy:
+        date_copied = pd.NaT
+        updates['Date Copied to Folder 1'] = pd.NaT
+
+    if exists2:
+        if pd.isna(date_copied):
+            try:
+                parent_dir = os.path.dirname(dest_path)
+                if parent_dir not in created_dirs:
+                    os.makedirs(parent_dir, exist_ok=True)
+                    created_dirs.add(parent_dir)
+                if deep_verify:
+                    copied_source_hash = copy_and_hash(source_path, dest_path)
+                else:
+                    fast_copy(source_path, dest_path)
+                dest_stat = os.stat(dest_path)
+                dst_index[relative_path] = dest_stat
+                updates['Date Copied to Folder 1'] = str(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                counts['copied'] += 1
+                status = "Copied"
+            except Exception as e:
+                status = f"Error copying: {str(e)}"
+                errors.append(f"[{datetime.now()}] {status} - {relative_path}")
+        else:
+            status = "Already Copied"
+
+        if dest_stat is not None:
+            source_size = source_stat.st_size
+            dest_size = dest_stat.st_size
+            source_mtime = source_stat.st_mtime_ns
+            dest_mtime = dest_stat.st_mtime_ns
+
+            if source_size != dest_size:
+                counts['mismatched'] += 1
+                status = "Size Mismatch"
+            elif not deep_verify and source_mtime == dest_mtime:
+                counts['verified'] += 1
+                if status != "Copied":
+                    status = "Verified"
+            else:
+                if checksums_cached(row, source_size, source_mtime, dest_size, dest_mtime):
+                    source_hash = row.get('Source Hash')
+                    dest_hash = row.get('Dest Hash')
+                    hashes_match = source_hash == dest_hash
+                elif copied_source_hash is not None:
+                    source_hash = copied_source_hash
+                    dest_hash = compute_checksum(dest_path)
+                    hashes_match = source_hash == dest_hash
+                else:
+                    hashes_match, digest = verify_pair(source_path, dest_path)
+                    source_hash = dest_hash = digest
+
+                if hashes_match:
+                    updates['Source Size'] = source_size
+                    updates['Source MTime'] = str(source_mtime)
+                    updates['Dest Size'] = dest_size
+                    updates['Dest MTime'] = str(dest_mtime)
+                    updates['Source Hash'] = source_hash
+                    updates['Dest Hash'] = dest_hash
+                    updates['Checksum Algorithm'] = DEFAULT_HASH_ALGO
+                    counts['verified'] += 1
+                    if status != "Copied":
+                        status = "Verified"
+                else:
+                    counts['mismatched'] += 1
+                    status = "Checksum Mismatch"
+    else:
+        status = "Missing in Folder 1"
+        counts['missing'] += 1
+        errors.append(f"[{datetime.now()}] Missing in Folder 1 - {relative_path}")
+
+    return index, relative_path, updates, status, counts, errors
 
-def sync_and_verify(folder1, folder2, report_path, progress_callback, status_callback, force_recopy=False):
+def sync_and_verify(folder1, folder2, report_path, progress_callback, status_callback, force_recopy=False, deep_verify=False):
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    error_log_entries = []
-    audit_records = []
+    state_path, audit_path = state_paths(report_path)
+
+    backup_state(state_path)
 
-    backup_excel(report_path)
+    status_callback("Scanning folders...")
+    src_index = {rel: entry_stat for entry_stat, rel in walk_fast(folder2)}
+    dst_index = {rel: entry_stat for entry_stat, rel in walk_fast(folder1)}
 
-    if os.path.exists(report_path):
+    if os.path.exists(state_path):
+        df = pd.read_parquet(state_path)
+    elif os.path.exists(report_path):
+        status_callback("Migrating legacy Excel report to Parquet state...")
         df = pd.read_excel(report_path, engine='openpyxl')
     else:
         file_records = []
-        for root, _, files in os.walk(folder2):
-            for file in files:
-                full_path = os.path.join(root, file)
-                relative_path = os.path.relpath(full_path, folder2)
-                file_records.append({
-                    'Relative Path': relative_path,
-                    'Source Path': full_path,
-                    'Date Copied to Folder 1': pd.NaT,
-                    'Exists in Folder 1': False,
-                    'Exists in Folder 2': True
-                })
+        for relative_path, entry_stat in src_index.items():
+            file_records.append({
+                'Relative Path': relative_path,
+                'Source Path': os.path.join(folder2, relative_path),
+                'Date Copied to Folder 1': pd.NaT,
+                'Exists in Folder 1': False,
+                'Exists in Folder 2': True,
+                'Source Size': entry_stat.st_size,
+                'Source MTime': str(entry_stat.st_mtime_ns)
+            })
         df = pd.DataFrame(file_records)
 
     total_files = len(df)
@@ -82,94 +347,108 @@ def sync_and_verify(folder1, folder2, report_path, progress_callback, status_cal
     mismatched_files = 0
     missing_files = 0
 
-    for index, row in df.iterrows():
-        relative_path = row.get('Relative Path')
-        source_path = row.get('Source Path')
-        dest_path = os.path.join(folder1, relative_path)
-
-        exists1 = file_exists(dest_path)
-        exists2 = file_exists(source_path)
-        df.at[index, 'Exists in Folder 1'] = exists1
-        df.at[index, 'Exists in Folder 2'] = exists2
-
-        status = ""
-        status_callback(f"Processing: {relative_path}")
-
-        if not exists2:
-            status = "Missing in Folder 2"
-            missing_files += 1
-            error_log_entries.append(f"[{datetime.now()}] Missing in Folder 2 - {relative_path}")
-        elif not exists1 and force_recopy:
-            df.at[index, 'Date Copied to Folder 1'] = pd.NaT
-
-        if exists2:
-            if pd.isna(df.at[index, 'Date Copied to Folder 1']):
-                try:
-                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                    shutil.copy2(source_path, dest_path)
-                    df.at[index, 'Date Copied to Folder 1'] = str(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-                    copied_files += 1
-                    status = "Copied"
-                except Exception as e:
-                    status = f"Error copying: {str(e)}"
-                    error_log_entries.append(f"[{datetime.now()}] {status} - {relative_path}")
-            else:
-                status = "Already Copied"
-
-            if file_exists(dest_path):
-                source_size = get_file_size(source_path)
-                dest_size = get_file_size(dest_path)
-
-                if source_size != dest_size:
-                    mismatched_files += 1
-                    status = "Size Mismatch"
-                else:
-                    source_hash = compute_checksum(source_path)
-                    dest_hash = compute_checksum(dest_path)
-                    if source_hash != dest_hash:
-                        mismatched_files += 1
-                        status = "Checksum Mismatch"
-                    else:
-                        verified_files += 1
-                        if status != "Copied":
-                            status = "Verified"
+    records = df.to_dict('records')
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    completed_files = 0
+    last_update = 0.0
+
+    write_header = not os.path.exists(audit_path)
+    audit_file = open(audit_path, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+    audit_writer = csv.DictWriter(audit_file, fieldnames=['Timestamp', 'Relative Path', 'Status'])
+    if write_header:
+        audit_writer.writeheader()
+
+    error_log_path = os.path.join(os.path.dirname(report_path), "copy_errors.log")
+    error_log = open(error_log_path, 'a', encoding='utf-8')
+    error_count = 0
+
+    created_dirs = set()
+    pending = []
+    for index, rec in enumerate(records):
+        if not deep_verify and fast_verify(rec, src_index, dst_index):
+            rec['Exists in Folder 1'] = True
+            rec['Exists in Folder 2'] = True
+            rec['Status'] = "Verified"
+            verified_files += 1
+            completed_files += 1
+            audit_writer.writerow({
+                'Timestamp': timestamp,
+                'Relative Path': rec.get('Relative Path'),
+                'Status': "Verified"
+            })
         else:
-            status = "Missing in Folder 1"
-            missing_files += 1
-            error_log_entries.append(f"[{datetime.now()}] Missing in Folder 1 - {relative_path}")
-
-        audit_records.append({
-            'Timestamp': timestamp,
-            'Relative Path': relative_path,
-            'Status': status
-        })
-
-        progress_callback(index + 1, total_files)
-
-    df.to_excel(report_path, index=False, engine='openpyxl')
+            pending.append(index)
+
+    progress_callback(completed_files, total_files)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(process_one, index, records[index], folder1, src_index, dst_index, created_dirs, force_recopy, deep_verify)
+            for index in pending
+        ]
+        for future in as_completed(futures):
+            index, relative_path, updates, status, counts, errors = future.result()
+
+            records[index].update(updates)
+
+            copied_files += counts['copied']
+            verified_files += counts['verified']
+            mismatched_files += counts['mismatched']
+            missing_files += counts['missing']
+            for entry in errors:
+                error_log.write(entry + "\n")
+            error_count += len(errors)
+
+            records[index]['Status'] = status
+            audit_writer.writerow({
+                'Timestamp': timestamp,
+                'Relative Path': relative_path,
+                'Status': status
+            })
+
+            completed_files += 1
+            now = time.monotonic()
+            if now - last_update >= 1 / 30 or completed_files == total_files:
+                last_update = now
+                status_callback(f"Processed: {relative_path}")
+                progress_callback(completed_files, total_files)
+
+    df = pd.DataFrame.from_records(records)
 
     try:
-        book = load_workbook(report_path)
-        audit_df = pd.DataFrame(audit_records)
-        sheet_name = f"audit_{timestamp}"
-        book.create_sheet(sheet_name)
-        sheet = book[sheet_name]
-        for r in dataframe_to_rows(audit_df, index=False, header=True):
-            sheet.append(r)
-
-        red_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-        main_sheet = book[book.sheetnames[0]]
-        for row in main_sheet.iter_rows(min_row=2, max_col=main_sheet.max_column):
-            status_cell = row[main_sheet.max_column - 3]
-            if status_cell.value in ["Missing in Folder 1", "Missing in Folder 2", "Size Mismatch", "Checksum Mismatch"]:
-                for cell in row:
-                    cell.fill = red_fill
-
-        book.save(report_path)
+        df.to_parquet(state_path, index=False, compression='zstd')
     except Exception as e:
-        error_log_entries.append(f"[{datetime.now()}] Failed to append audit sheet: {str(e)}")
-
-    return copied_files, verified_files, mismatched_files, missing_files, error_log_entries
+        error_log.write(f"[{datetime.now()}] Failed to save state: {str(e)}\n")
+        error_count += 1
+
+    audit_file.close()
+    error_log.close()
+
+    return copied_files, verified_files, mismatched_files, missing_files, error_count
+
+def export_excel_report(report_path):
+    state_path, audit_path = state_paths(report_path)
+    if not os.path.exists(state_path):
+        return False
+
+    df = pd.read_parquet(state_path)
+    with pd.ExcelWriter(report_path, engine='xlsxwriter') as writer:
+        df.to_excel(writer, sheet_name='Sync', index=False)
+        if os.path.exists(audit_path):
+            pd.read_csv(audit_path).to_excel(writer, sheet_name='Audit', index=False)
+
+        red_format = writer.book.add_format({'bg_color': '#FFC7CE'})
+        sync_sheet = writer.sheets['Sync']
+        if 'Status' in df.columns:
+            status_col = df.columns.get_loc('Status')
+            for criteria in ('Missing', 'Mismatch'):
+                sync_sheet.conditional_format(1, status_col, len(df), status_col, {
+                    'type': 'text',
+                    'criteria': 'containing',
+                    'value': criteria,
+                    'format': red_format
+                })
+    return True
 
 def run_sync_thread():
     run_button.config(state="disabled")
@@ -177,24 +456,27 @@ def run_sync_thread():
     status_label.config(text="Starting sync...")
 
     def update_progress(current, total):
-        progress_bar["maximum"] = total
-        progress_bar["value"] = current
+        def apply():
+            progress_bar["maximum"] = total
+            progress_bar["value"] = current
+        root.after_idle(apply)
 
     def update_status(msg):
-        status_label.config(text=msg)
+        root.after_idle(lambda: status_label.config(text=msg))
 
     def task():
         folder1 = folder1_var.get()
         folder2 = folder2_var.get()
         force_recopy = force_recopy_var.get()
+        deep_verify = deep_verify_var.get()
         if not folder1 or not folder2:
             messagebox.showerror("Error", "Please select both folders.")
             run_button.config(state="normal")
             return
 
         report_path = os.path.join(os.getcwd(), "missing_files_report.xlsx")
-        copied, verified, mismatched, missing, errors = sync_and_verify(
-            folder1, folder2, report_path, update_progress, update_status, force_recopy
+        copied, verified, mismatched, missing, error_count = sync_and_verify(
+            folder1, folder2, report_path, update_progress, update_status, force_recopy, deep_verify
         )
 
         summary = (
@@ -203,10 +485,8 @@ def run_sync_thread():
             f"⚠️ Mismatched: {mismatched}\n"
             f"❌ Missing: {missing}\n"
         )
-        if errors:
-            summary += f"\n📝 Errors logged: {len(errors)}"
-            with open("copy_errors.log", "w", encoding="utf-8") as f:
-                f.write("\n".join(errors))
+        if error_count:
+            summary += f"\n📝 Errors logged: {error_count} (see copy_errors.log)"
 
         messagebox.showinfo("Sync Summary", summary)
         run_button.config(state="normal")
@@ -214,6 +494,16 @@ def run_sync_thread():
 
     threading.Thread(target=task).start()
 
+def generate_excel_report():
+    report_path = os.path.join(os.getcwd(), "missing_files_report.xlsx")
+    try:
+        if export_excel_report(report_path):
+            messagebox.showinfo("Report", f"Excel report saved to:\n{report_path}")
+        else:
+            messagebox.showerror("Report", "No sync state found. Run a sync first.")
+    except Exception as e:
+        messagebox.showerror("Report", f"Failed to generate report: {e}")
+
 def browse_folder1():
     path = filedialog.askdirectory()
     if path:
@@ -234,6 +524,7 @@ frame.grid()
 folder1_var = tk.StringVar()
 folder2_var = tk.StringVar()
 force_recopy_var = tk.BooleanVar()
+deep_verify_var = tk.BooleanVar()
 
 ttk.Label(frame, text="Internal Folder (Folder 1):").grid(column=0, row=0, sticky="w")
 ttk.Entry(frame, textvariable=folder1_var, width=60).grid(column=1, row=0)
@@ -245,13 +536,17 @@ ttk.Button(frame, text="Browse", command=browse_folder2).grid(column=2, row=1)
 
 ttk.Checkbutton(frame, text="Force re-copy files missing in Folder 1", variable=force_recopy_var).grid(column=1, row=2, sticky="w")
 
+ttk.Checkbutton(frame, text="Deep verify (checksum every file)", variable=deep_verify_var).grid(column=1, row=3, sticky="w")
+
 run_button = ttk.Button(frame, text="Run Sync & Verify", command=run_sync_thread)
-run_button.grid(column=1, row=3, pady=10)
+run_button.grid(column=1, row=4, pady=10)
+
+ttk.Button(frame, text="Generate Excel Report", command=generate_excel_report).grid(column=2, row=4)
 
 progress_bar = ttk.Progressbar(frame, orient="horizontal", length=400, mode="determinate")
-progress_bar.grid(column=1, row=4, pady=5)
+progress_bar.grid(column=1, row=5, pady=5)
 
 status_label = ttk.Label(frame, text="Ready.", width=60)
-status_label.grid(column=1, row=5, pady=5)
+status_label.grid(column=1, row=6, pady=5)
 
 root.mainloop()